@@ -1,15 +1,112 @@
+import asyncio
+import collections
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import logging
+import numbers
 import time
-import random
+import re
 from typing import Dict, List, Optional, Tuple, Union
 from itertools import cycle
 
+# Only advertise Brotli when it can be decoded; requests/aiohttp need the brotli package for it
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# Numba is optional; without it batch scoring uses the vectorized NumPy path
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    # fastmath without the no-NaN/no-inf flags: missing metrics are NaN and must fail the bound checks
+    @njit(parallel=True, fastmath={'nsz', 'arcp', 'contract', 'reassoc'}, cache=True)
+    def _score_batch_jit(values, offset, sign, scale, lower, closed, distance_from, groups):
+        """Compiled row-parallel equivalent of FinvizScraper._calculate_scores for a 2-D input."""
+        n_rows, n_metrics = values.shape
+        n_groups = groups.shape[0]
+        out = np.zeros((n_rows, n_groups))
+        
+        for i in prange(n_rows):
+            for k in range(n_groups):
+                end = groups[k + 1] if k + 1 < n_groups else n_metrics
+                total = 0.0
+                count = 0
+                for j in range(groups[k], end):
+                    v = values[i, j]
+                    if v > lower[j] or (closed[j] and v == lower[j]):
+                        x = v if np.isnan(distance_from[j]) else abs(distance_from[j] - v)
+                        total += min(100.0, max(0.0, (offset[j] + sign[j] * x) * scale[j]))
+                        count += 1
+                if count > 0:
+                    out[i, k] = total / count
+        
+        return out
+else:
+    _score_batch_jit = None
+
 class FinvizScraper:
+    # Tag scanners for slicing the scraped tables out of the page. Each one also matches
+    # comments, scripts and styles (group 'skip') so tags inside those are ignored. The
+    # shared leading '<' keeps the regex engine on its fast literal-prefix search.
+    _SKIP_SPANS = rb'!--.*?-->|script\b.*?</script\s*>|style\b.*?</style\s*>'
+    _TABLE_TAG_RE = re.compile(
+        rb'<(?:(?P<skip>' + _SKIP_SPANS + rb')|(?P<close>/?)table\b)',
+        re.IGNORECASE | re.DOTALL
+    )
+    # Opening tags of the tables we scrape, matched on whole class tokens / ids
+    _SNAPSHOT_TABLE_RE = re.compile(
+        rb'<(?:(?P<skip>' + _SKIP_SPANS + rb')|table\b[^>]*'
+        rb'(?<![\w-])class\s*=\s*["\'][^"\']*(?<![\w-])snapshot-table2(?![\w-]))',
+        re.IGNORECASE | re.DOTALL
+    )
+    _SECTOR_TABLE_RE = re.compile(
+        rb'<(?:(?P<skip>' + _SKIP_SPANS + rb')|table\b[^>]*(?:'
+        rb'(?<![\w-])class\s*=\s*["\'][^"\']*(?<![\w-])(?:table-light|groups-table-overview)(?![\w-])'
+        rb'|(?<![\w-])id\s*=\s*["\']groups-table-overview["\']))',
+        re.IGNORECASE | re.DOTALL
+    )
+    # CSS selectors for the scraped tables (selectolax compiles them on each css() call)
+    _SNAPSHOT_CELLS_CSS = 'table.snapshot-table2 td'
+    _SECTOR_TABLE_CSS = 'table.table-light, table.groups-table-overview, table#groups-table-overview'
+    _SECTOR_HEADER_CSS = 'tr.table-header td'
+    # Rating inputs, grouped as valuation (3), growth (2) and financial health (2).
+    # Each score is clip((offset + sign * x) * scale, 0, 100), counted only when the
+    # metric is above its lower bound (or equal to it, where closed). x is the metric
+    # itself, or its distance |distance_from - metric| where distance_from is set (PEG).
+    _SCORE_METRICS = (
+        'P/E', 'PEG', 'P/B',
+        'EPS growth next 5 years', 'Sales growth past 5 years',
+        'Current Ratio', 'Debt/Equity'
+    )
+    _SCORE_GROUPS = np.array([0, 3, 5])
+    _SCORE_OFFSET = np.array([30, 2, 5, 0, 0, 0, 2], dtype=float)
+    _SCORE_SIGN = np.array([-1, -1, -1, 1, 1, 1, -1], dtype=float)
+    _SCORE_SCALE = np.array([3.33, 50, 20, 5, 5, 50, 50], dtype=float)
+    _SCORE_LOWER = np.array([0, 0, 0, -np.inf, -np.inf, 0, 0], dtype=float)
+    _SCORE_CLOSED = np.array([False, False, False, False, False, False, True])
+    _SCORE_DISTANCE_FROM = np.array([np.nan, 1, np.nan, np.nan, np.nan, np.nan, np.nan])
+    # Content negotiation headers sent with every request (and with cache lookups, so
+    # responses that Vary on them still match)
+    _ACCEPT_HEADERS = {
+        "Accept": "text/html",
+        "Accept-Encoding": ACCEPT_ENCODING
+    }
+    # Cell value normalisation for _convert_value
+    _STRIP_CHARS = str.maketrans('', '', ',%')
+    _NUMBER_RE = re.compile(r'^[-+]?\d+(?:\.\d+)?$')
+
     def __init__(self, proxies: Optional[List[str]] = None):
         self.base_url = "https://finviz.com"
         self.user_agents = [
@@ -21,14 +118,40 @@ class FinvizScraper:
         ]
         self.user_agent_cycle = cycle(self.user_agents)
         
-        # Set up proxy rotation if provided
-        self.proxies = None
-        if proxies:
-            self.proxies = cycle(proxies)
+        # Set up proxy rotation if provided; failing proxies sit out a cooldown
+        self._proxy_pool = collections.deque(proxies or [])
+        self._proxy_cooldown = {}  # proxy -> monotonic time it may be used again
+        self.proxy_cooldown_seconds = 60
         
         self.logger = self._setup_logger()
-        self.last_request_time = 0
-        self.min_request_interval = 2  # Minimum seconds between requests
+        
+        # Reuse connections across requests (keep-alive), retry transient failures, and
+        # cache pages for a few minutes so repeat lookups during a screen skip the network
+        self.session = CachedSession(
+            'finviz_cache',
+            backend='sqlite',
+            expire_after=300,
+            allowable_codes=(200,),
+            cache_control=True
+        )
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Token bucket rate limiting: allow short bursts, average refill_rate requests/sec
+        self._capacity = 4.0
+        self._refill_rate = 0.5
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
 
     def _setup_logger(self) -> logging.Logger:
         """Configure logging for the scraper."""
@@ -51,34 +174,179 @@ class FinvizScraper:
             url (str): The URL to request
             
         Returns:
-            requests.Response: The response from the server
+            requests.Response: The response from the server (or the local cache)
         """
+        # Serve fresh cached pages without spending a rate limit token
+        cached = self.session.get(url, headers=self._ACCEPT_HEADERS, only_if_cached=True)
+        if cached.status_code == 200:
+            return cached
+        
         # Implement rate limiting
-        time_since_last_request = time.time() - self.last_request_time
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
-            time.sleep(sleep_time)
+        self._acquire()
         
         # Rotate user agent
-        headers = {"User-Agent": next(self.user_agent_cycle)}
+        headers = self._build_headers()
         
         # Get next proxy if available
         proxies = None
-        if self.proxies:
-            proxy = next(self.proxies)
+        proxy = self._pick_proxy()
+        if proxy:
             proxies = {
                 "http": proxy,
                 "https": proxy
             }
         
-        # Add some randomization to seem more human-like
-        time.sleep(random.uniform(0.5, 1.5))
+        try:
+            response = self.session.get(url, headers=headers, proxies=proxies, timeout=(5, 15))
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            # ConnectionError covers ProxyError and retries exhausted by the mounted Retry
+            self._evict_proxy(proxy)
+            raise
         
-        response = requests.get(url, headers=headers, proxies=proxies)
-        self.last_request_time = time.time()
+        if response.status_code == 429:
+            self._penalize()
+        if self._is_blocked_status(response.status_code):
+            self._evict_proxy(proxy)
         
         return response
 
+    def _pick_proxy(self) -> Optional[str]:
+        """
+        Rotate to the next proxy that is not cooling down.
+        
+        Returns:
+            str: The proxy URL, or None if no proxies are configured. If every proxy
+                is cooling down, the one whose cooldown ends first is returned.
+        """
+        if not self._proxy_pool:
+            return None
+        
+        now = time.monotonic()
+        for _ in range(len(self._proxy_pool)):
+            proxy = self._proxy_pool[0]
+            self._proxy_pool.rotate(-1)
+            if self._proxy_cooldown.get(proxy, 0) <= now:
+                self._proxy_cooldown.pop(proxy, None)
+                return proxy
+        
+        return min(self._proxy_pool, key=lambda p: self._proxy_cooldown.get(p, 0))
+
+    def _evict_proxy(self, proxy: Optional[str]) -> None:
+        """Bench a failing proxy for proxy_cooldown_seconds."""
+        if proxy is None:
+            return
+        self.logger.warning(f"Proxy {proxy} failed, cooling down for {self.proxy_cooldown_seconds}s")
+        self._proxy_cooldown[proxy] = time.monotonic() + self.proxy_cooldown_seconds
+
+    def _is_blocked_status(self, status: int) -> bool:
+        """Whether a status code suggests the proxy is blocked or broken rather than the page missing."""
+        return status in (403, 407, 429) or status >= 500
+
+    def _build_headers(self) -> Dict[str, str]:
+        """Request headers with the next user agent, asking for a compressed response."""
+        return {"User-Agent": next(self.user_agent_cycle), **self._ACCEPT_HEADERS}
+
+    def _reserve(self, n: int = 1) -> float:
+        """
+        Take n tokens from the bucket, borrowing against future refills if needed.
+        
+        Args:
+            n (int): Number of tokens to take
+            
+        Returns:
+            float: Seconds the caller must wait before sending the request
+        """
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._refill_rate)
+        self._last_refill = now
+        
+        wait = 0.0
+        if self._tokens < n:
+            wait = (n - self._tokens) / self._refill_rate
+        self._tokens -= n
+        
+        return wait
+
+    def _acquire(self, n: int = 1) -> None:
+        """Block until n tokens are available."""
+        wait = self._reserve(n)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def _acquire_async(self, n: int = 1) -> None:
+        """Wait, without blocking the event loop, until n tokens are available."""
+        wait = self._reserve(n)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _penalize(self) -> None:
+        """Drain the bucket after the server signals we are sending too fast (HTTP 429)."""
+        self.logger.warning("Rate limited by server, backing off")
+        self._tokens = min(-1, self._tokens - self._refill_rate)
+
+    def _strain_table(self, html: bytes, table_re: re.Pattern) -> bytes:
+        """
+        Cut the page down to every table whose opening tag matches table_re, including
+        any tables nested inside them. Table tags inside comments, scripts and styles
+        are ignored.
+        
+        Args:
+            html (bytes): The full page HTML
+            table_re (re.Pattern): Scanner matching the table's opening tag (or a span to skip)
+            
+        Returns:
+            bytes: The tables' HTML, or the full page if none could be cleanly located
+        """
+        slices = []
+        pos = 0
+        while True:
+            # Outside a target table only its opening tag matters
+            match = table_re.search(html, pos)
+            while match and match.group('skip'):
+                match = table_re.search(html, match.end())
+            if not match:
+                break
+            
+            # Find the matching close tag, counting nested tables
+            depth = 1
+            for tag in self._TABLE_TAG_RE.finditer(html, match.end()):
+                if tag.group('skip'):
+                    continue
+                depth += -1 if tag.group('close') else 1
+                if depth == 0:
+                    break
+            end = html.find(b'>', tag.end()) if depth == 0 else -1
+            
+            # An unclosed table means the markup is not what we expect; parse everything
+            if end == -1:
+                return html
+            slices.append(html[match.start():end + 1])
+            pos = end + 1
+        
+        if not slices:
+            return html
+        return b''.join(slices)
+
+    def _select(self, html: bytes, table_re: re.Pattern, css: str, paired: bool = False) -> list:
+        """
+        Run a CSS query against the tables matched by table_re, re-parsing the full page
+        if the slice looks wrong (no matches, or an odd count when paired).
+        
+        Args:
+            html (bytes): The full page HTML
+            table_re (re.Pattern): Scanner matching the table's opening tag (see _strain_table)
+            css (str): The CSS selector to run
+            paired (bool): If True, expect an even number of nodes (label, value cells)
+            
+        Returns:
+            list: The matching nodes
+        """
+        table_html = self._strain_table(html, table_re)
+        nodes = LexborHTMLParser(table_html).css(css)
+        if table_html is not html and (not nodes or (paired and len(nodes) % 2)):
+            nodes = LexborHTMLParser(html).css(css)
+        return nodes
+
     def get_company_data(self, url: str, debug: bool = False) -> Dict[str, Union[str, float]]:
         """
         Scrape company financial data from a Finviz stock page.
@@ -91,27 +359,16 @@ class FinvizScraper:
             dict: Dictionary containing company financial metrics
         """
         try:
-            self.logger.info(f"Fetching data from {url}")
+            self.logger.info("Fetching data from %s", url)
             response = self._make_request(url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            data = {}
+            # Hand the raw bytes to the parser; decoding to str first would copy the page
+            data = self._parse_company_data(response.content)
             
-            # Extract table data
-            tables = soup.find_all('table', class_='snapshot-table2')
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    columns = row.find_all('td')
-                    for i in range(0, len(columns), 2):
-                        if i + 1 < len(columns):
-                            key = columns[i].text.strip()
-                            value = columns[i + 1].text.strip()
-                            data[key] = self._convert_value(value)
-            
-            if debug:
-                self.logger.debug(f"Scraped data: {data}")
+            # Only format the (large) dict when it will actually be logged
+            if debug and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Scraped data: %s", data)
             
             return data
             
@@ -119,6 +376,111 @@ class FinvizScraper:
             self.logger.error(f"Error scraping company data: {str(e)}")
             raise
 
+    async def _fetch(self, session: aiohttp.ClientSession, url: str) -> bytes:
+        """
+        Fetch a page asynchronously with a rotated user agent and proxy.
+        
+        Args:
+            session (aiohttp.ClientSession): The shared session for the batch
+            url (str): The URL to request
+            
+        Returns:
+            bytes: The response body
+        """
+        # Wait for a token first, so the proxy is picked after any cooldowns set meanwhile
+        await self._acquire_async()
+        
+        headers = self._build_headers()
+        proxy = self._pick_proxy()
+        
+        try:
+            async with session.get(url, headers=headers, proxy=proxy) as response:
+                if response.status == 429:
+                    self._penalize()
+                if self._is_blocked_status(response.status):
+                    self._evict_proxy(proxy)
+                response.raise_for_status()
+                return await response.read()
+        except (aiohttp.ClientProxyConnectionError, aiohttp.ClientHttpProxyError, asyncio.TimeoutError):
+            self._evict_proxy(proxy)
+            raise
+
+    async def get_company_data_many(self, urls: List[str]) -> pd.DataFrame:
+        """
+        Scrape company financial data for several Finviz stock pages concurrently.
+        
+        Args:
+            urls (list): The Finviz URLs for the stocks
+        
+        Returns:
+            pd.DataFrame: One row of company financial metrics per url that was scraped
+                successfully, with numeric metrics as float32 and text fields as
+                categories. Failed urls are logged and left out.
+        """
+        semaphore = asyncio.Semaphore(int(self._capacity))
+        connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=30, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(connect=5, sock_read=15)  # Same as the sync path
+        
+        async def fetch_one(session: aiohttp.ClientSession, url: str) -> Dict[str, Union[str, float]]:
+            async with semaphore:
+                self.logger.info("Fetching data from %s", url)
+                html = await self._fetch(session, url)
+            return self._parse_company_data(html)
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            results = await asyncio.gather(
+                *(fetch_one(session, url) for url in urls),
+                return_exceptions=True
+            )
+        
+        # Keep the pages that succeeded; one bad ticker should not sink the batch
+        records = []
+        scraped_urls = []
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"Error scraping company data from {url}: {str(result)}")
+            else:
+                records.append(result)
+                scraped_urls.append(url)
+        
+        if urls and not records:
+            raise RuntimeError(f"Failed to scrape company data for all {len(urls)} urls")
+        
+        return self._to_metrics_frame(records, index=scraped_urls)
+
+    def _parse_company_data(self, html: bytes) -> Dict[str, Union[str, float]]:
+        """Extract the snapshot table metrics from a Finviz stock page."""
+        # Extract table data: a single query for all cells, which alternate label, value
+        cells = iter(self._select(html, self._SNAPSHOT_TABLE_RE, self._SNAPSHOT_CELLS_CSS, paired=True))
+        return {
+            key.text(strip=True): self._convert_value(value.text(strip=True))
+            for key, value in zip(cells, cells)
+        }
+
+    def _to_metrics_frame(self, records: List[Dict[str, Union[str, float]]], index: List[str]) -> pd.DataFrame:
+        """
+        Stack scraped company records into a compact columnar frame.
+        
+        Columns with any numeric value (plus the rating inputs) become float32, with
+        placeholders such as '-' as NaN; the remaining text columns become categories.
+        A rating input absent from a record is stored as 0, the default
+        get_stock_rating_data uses, so it stays distinct from a '-' placeholder.
+        """
+        df = pd.DataFrame.from_records(records, index=index)
+        
+        score_cols = df.columns[df.columns.isin(self._SCORE_METRICS)]
+        df[score_cols] = df[score_cols].fillna(0)
+        
+        numeric = df.apply(pd.to_numeric, errors='coerce')
+        is_numeric = numeric.notna().any() | df.columns.isin(self._SCORE_METRICS)
+        num_cols = df.columns[is_numeric]
+        text_cols = df.columns[~is_numeric]
+        
+        df[num_cols] = numeric[num_cols].astype('float32')
+        df[text_cols] = df[text_cols].astype('category')
+        
+        return df
+
     def get_sector_data(self) -> pd.DataFrame:
         """
         Scrape sector performance data from Finviz.
@@ -133,36 +495,37 @@ class FinvizScraper:
             response = self._make_request(url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
             # Try different table classes as Finviz might update their HTML structure
-            table = soup.find('table', class_='table-light') or \
-                   soup.find('table', class_='groups-table-overview') or \
-                   soup.find('table', {'id': 'groups-table-overview'})
+            tables = self._select(response.content, self._SECTOR_TABLE_RE, self._SECTOR_TABLE_CSS)
             
-            if not table:
+            if not tables:
                 raise ValueError("Sector table not found")
+            table = tables[0]
             
             data = []
-            headers = []
             
             # Get headers
-            header_row = table.find('tr', class_='table-header')
-            if header_row:
-                headers = [th.text.strip() for th in header_row.find_all('td')]
+            headers = [td.text(strip=True) for td in table.css(self._SECTOR_HEADER_CSS)]
             
             # Get sector data
-            rows = table.find_all('tr')[1:]  # Skip header row
+            rows = table.css('tr')[1:]  # Skip header row
             for row in rows:
-                cols = row.find_all('td')
-                row_data = [col.text.strip() for col in cols]
+                # Walk direct children rather than compiling a 'td' selector for every row
+                row_data = [col.text(strip=True) for col in row.iter() if col.tag == 'td']
                 data.append(row_data)
             
             df = pd.DataFrame(data, columns=headers)
             
-            # Convert percentage strings to floats
-            for col in df.columns:
-                if '%' in df[col].iloc[0]:
-                    df[col] = df[col].str.rstrip('%').astype('float') / 100
+            # Convert percentage columns to float32 fractions in one vectorized pass
+            # (placeholders such as '-' become NaN)
+            text_cols = df.select_dtypes(include=['object', 'string']).columns
+            if len(text_cols):
+                is_pct = df[text_cols].apply(lambda s: s.str.endswith('%', na=False).any())
+                pct_cols = is_pct[is_pct].index
+                if len(pct_cols):
+                    df[pct_cols] = df[pct_cols].apply(
+                        lambda s: pd.to_numeric(s.str.rstrip('%'), errors='coerce').astype('float32') / 100.0
+                    )
             
             return df
             
@@ -181,39 +544,59 @@ class FinvizScraper:
             dict: Dictionary containing calculated ratings
         """
         try:
-            ratings = {}
+            values = np.array([
+                value if isinstance(value, numbers.Real) else np.nan
+                for value in (company_data.get(metric, 0) for metric in self._SCORE_METRICS)
+            ], dtype=float)
             
-            # Valuation Rating (P/E, PEG, P/B)
-            pe_ratio = company_data.get('P/E', 0)
-            peg_ratio = company_data.get('PEG', 0)
-            pb_ratio = company_data.get('P/B', 0)
-            
-            ratings['valuation_score'] = self._calculate_valuation_score(
-                pe_ratio, peg_ratio, pb_ratio
-            )
+            valuation, growth, financial_health = self._calculate_scores(values)
             
-            # Growth Rating
-            earnings_growth = company_data.get('EPS growth next 5 years', 0)
-            sales_growth = company_data.get('Sales growth past 5 years', 0)
+            return {
+                'valuation_score': float(valuation),
+                'growth_score': float(growth),
+                'financial_health_score': float(financial_health),
+                'overall_score': float((valuation + growth + financial_health) / 3)
+            }
             
-            ratings['growth_score'] = self._calculate_growth_score(
-                earnings_growth, sales_growth
+        except Exception as e:
+            self.logger.error(f"Error calculating stock ratings: {str(e)}")
+            raise
+
+    def get_stock_rating_data_batch(self, metrics: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calculate stock ratings for many tickers at once.
+        
+        Args:
+            metrics (pd.DataFrame): One row per ticker, with columns named like the
+                keys returned by get_company_data
+        
+        Returns:
+            pd.DataFrame: The get_stock_rating_data scores as columns, indexed like metrics
+        """
+        try:
+            values = (
+                # Absent metrics default to 0, as in get_stock_rating_data; NaN cells stay missing
+                metrics.reindex(columns=list(self._SCORE_METRICS), fill_value=0)
+                .apply(pd.to_numeric, errors='coerce')
+                .to_numpy(dtype=float)
             )
             
-            # Financial Health Rating
-            current_ratio = company_data.get('Current Ratio', 0)
-            debt_equity = company_data.get('Debt/Equity', 0)
+            if _score_batch_jit is not None:
+                scores = _score_batch_jit(
+                    np.ascontiguousarray(values),
+                    self._SCORE_OFFSET, self._SCORE_SIGN, self._SCORE_SCALE,
+                    self._SCORE_LOWER, self._SCORE_CLOSED, self._SCORE_DISTANCE_FROM,
+                    self._SCORE_GROUPS
+                )
+            else:
+                scores = self._calculate_scores(values)
             
-            ratings['financial_health_score'] = self._calculate_financial_health_score(
-                current_ratio, debt_equity
+            ratings = pd.DataFrame(
+                scores,
+                index=metrics.index,
+                columns=['valuation_score', 'growth_score', 'financial_health_score']
             )
-            
-            # Calculate overall rating
-            ratings['overall_score'] = np.mean([
-                ratings['valuation_score'],
-                ratings['growth_score'],
-                ratings['financial_health_score']
-            ])
+            ratings['overall_score'] = scores.mean(axis=1)
             
             return ratings
             
@@ -223,68 +606,37 @@ class FinvizScraper:
 
     def _convert_value(self, value: str) -> Union[float, str]:
         """Convert string values to appropriate numeric types."""
-        try:
-            # Remove any commas and percentage signs
-            value = value.replace(',', '').replace('%', '')
-            
-            # Try converting to float
-            return float(value)
-        except ValueError:
-            # Return original string if conversion fails
-            return value
-
-    def _calculate_valuation_score(self, pe: float, peg: float, pb: float) -> float:
-        """Calculate valuation score based on P/E, PEG, and P/B ratios."""
-        scores = []
-        
-        # P/E Score (lower is better, but should be positive)
-        if pe > 0:
-            pe_score = max(0, min(100, (30 - pe) * 3.33))
-            scores.append(pe_score)
-        
-        # PEG Score (closer to 1 is better)
-        if peg > 0:
-            peg_score = max(0, min(100, (2 - abs(1 - peg)) * 50))
-            scores.append(peg_score)
-        
-        # P/B Score (lower is better, but should be positive)
-        if pb > 0:
-            pb_score = max(0, min(100, (5 - pb) * 20))
-            scores.append(pb_score)
-        
-        return np.mean(scores) if scores else 0
-
-    def _calculate_growth_score(self, earnings_growth: float, sales_growth: float) -> float:
-        """Calculate growth score based on earnings and sales growth."""
-        scores = []
+        # Remove any commas and percentage signs in a single pass
+        stripped = value.translate(self._STRIP_CHARS)
         
-        # Earnings Growth Score
-        if earnings_growth is not None:
-            earnings_score = max(0, min(100, earnings_growth * 5))
-            scores.append(earnings_score)
-        
-        # Sales Growth Score
-        if sales_growth is not None:
-            sales_score = max(0, min(100, sales_growth * 5))
-            scores.append(sales_score)
-        
-        return np.mean(scores) if scores else 0
+        # Only plain decimals are converted; anything else (e.g. '2.50B', '-') stays a string
+        if self._NUMBER_RE.match(stripped):
+            return float(stripped)
+        return stripped
 
-    def _calculate_financial_health_score(self, current_ratio: float, debt_equity: float) -> float:
-        """Calculate financial health score based on current ratio and debt/equity."""
-        scores = []
+    def _calculate_scores(self, values: np.ndarray) -> np.ndarray:
+        """
+        Score the _SCORE_METRICS inputs and average them per rating group.
         
-        # Current Ratio Score (higher is better, optimal around 2)
-        if current_ratio > 0:
-            current_ratio_score = max(0, min(100, current_ratio * 50))
-            scores.append(current_ratio_score)
+        Args:
+            values (np.ndarray): Metric values along the last axis, NaN where missing
         
-        # Debt/Equity Score (lower is better)
-        if debt_equity >= 0:
-            debt_equity_score = max(0, min(100, (2 - debt_equity) * 50))
-            scores.append(debt_equity_score)
+        Returns:
+            np.ndarray: Valuation, growth and financial health scores along the last axis
+        """
+        with np.errstate(invalid='ignore'):
+            x = np.where(
+                np.isnan(self._SCORE_DISTANCE_FROM),
+                values,
+                np.abs(self._SCORE_DISTANCE_FROM - values)
+            )
+            valid = (values > self._SCORE_LOWER) | (self._SCORE_CLOSED & (values == self._SCORE_LOWER))
+            scores = np.clip((self._SCORE_OFFSET + self._SCORE_SIGN * x) * self._SCORE_SCALE, 0, 100)
         
-        return np.mean(scores) if scores else 0
+        # Mean of the valid scores in each group; a group with no valid inputs scores 0
+        totals = np.add.reduceat(np.where(valid, scores, 0), self._SCORE_GROUPS, axis=-1)
+        counts = np.add.reduceat(valid.astype(int), self._SCORE_GROUPS, axis=-1)
+        return np.divide(totals, counts, out=np.zeros_like(totals), where=counts > 0)
 
 # Usage example
 if __name__ == "__main__":